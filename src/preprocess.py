@@ -1,7 +1,106 @@
+import warnings
+
 import numpy as np 
 import pandas as pd 
 from sklearn.base import BaseEstimator, TransformerMixin
 
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: add_numeric_features falls back to numpy
+    njit = None
+
+try:
+    import numexpr
+except ImportError:  # Optional: pd.eval arithmetic falls back to numpy
+    numexpr = None
+
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+if _PANDAS_MAJOR == 2:
+    pd.set_option("mode.copy_on_write", True)  # Always on from pandas 3.0
+# With Copy-on-Write a shallow copy is enough to keep the caller's frame untouched
+_DEEP_COPY = _PANDAS_MAJOR < 2
+
+# Output dtypes of replace_diet_habits/replace_sleep_duration: kept categories, then the catch-all
+_DIET_DTYPE = pd.CategoricalDtype(["Moderate", "Unhealthy", "Healthy", "Other"])
+_SLEEP_DTYPE = pd.CategoricalDtype(["Less than 5 hours", "7-8 hours", "More than 8 hours", "5-6 hours", "other"])
+
+def _ensure_occ_category(data):
+    """
+    Cast 'Working Professional or Student' to a categorical dtype in place.
+
+    Comparing integer category codes is much cheaper than re-scanning an
+    object column of Python strings in every preprocessing step. No-op if the
+    column is already categorical.
+
+    Args:
+        data (pd.DataFrame):
+            DataFrame containing 'Working Professional or Student'.
+
+    Returns:
+        pd.DataFrame:
+            The same DataFrame, with the occupation column as 'category'.
+    """
+
+    if not isinstance(data["Working Professional or Student"].dtype, pd.CategoricalDtype):
+        data["Working Professional or Student"] = data["Working Professional or Student"].astype("category")
+    return data
+
+def _occupation_code(data, label):
+    """
+    Look up the category code of an occupation label (-2 if absent, never matches a code).
+    """
+
+    categories = data["Working Professional or Student"].cat.categories
+    return categories.get_loc(label) if label in categories else -2
+
+def _occupation_codes(data):
+    """
+    Integer category codes of the occupation column (-1 for missing).
+
+    Reads the codes stored on the Categorical itself, so no Series is built and
+    nothing is recomputed; each step fetches them once and reuses the array.
+    """
+
+    return data["Working Professional or Student"].array.codes
+
+def _float_values(values):
+    """
+    Float ndarray of a numeric column or array, keeping float32 if it was downcast.
+    """
+
+    dtype = np.float32 if values.dtype == np.float32 else np.float64
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+def downcast_columns(data):
+    """
+    Shrink the raw columns the preprocessing steps scan repeatedly.
+
+    The 1-5 scale scores become float32 and the low-cardinality labels become
+    categoricals (int8 codes), cutting the bytes moved by every later step.
+    Opt-in: add it as the first pipeline step to get float32 through the
+    pandas steps. The Preprocessing notebook does not use it, because the saved
+    model was trained on float64 features and float32 shifts the
+    Pressure_Satisfaction_Ratio values slightly (relative ~1e-7).
+
+    Args:
+        data (pd.DataFrame):
+            Raw input DataFrame.
+
+    Returns:
+        pd.DataFrame:
+            DataFrame with downcast score and label columns
+    """
+
+    data=data.copy(deep=_DEEP_COPY)
+    for col in ["Academic Pressure", "Work Pressure", "Study Satisfaction", "Job Satisfaction", "Financial Stress"]:
+        data[col] = data[col].astype(np.float32)
+    for col in ["Working Professional or Student", "Dietary Habits", "Sleep Duration", "Profession"]:
+        data[col] = data[col].astype("category")
+
+    return data 
+
 def assign_pressure(data):
     """
     Create unified 'Pressure' feature from academic/work pressure columns based on occupation.
@@ -13,35 +112,53 @@ def assign_pressure(data):
     Args:
         data (pd.DataFrame):  
             Input dataframe containing:
-            - 'Working Professional or Student' (str): Occupation category
+            - 'Working Professional or Student' (str or category): Occupation category
             - 'Academic Pressure' (float): Student pressure (1-5 scale)
             - 'Work Pressure' (float): Professional pressure (1-5 scale)
 
     Returns:
         pd.DataFrame:
-            Original DataFrame with new 'Pressure' column (float, 1-5 scale)
+            Original DataFrame with new 'Pressure' column (float32 if inputs were downcast, 1-5 scale)
     """
     
-    data=data.copy()
-    is_student = data["Working Professional or Student"] == "Student"
-    is_professional = data["Working Professional or Student"] == "Working Professional"
-
-    data["Pressure"] = np.where(
-        is_student,
-        data["Academic Pressure"],
-        np.where(
-            is_professional,
-            data["Work Pressure"], 
-            np.where(
-                data["Academic Pressure"].notna() & data["Work Pressure"].notna(),
-                data[["Academic Pressure", "Work Pressure"]].max(axis=1),  # Max for hybrids
-                np.nan  # Fallback for edge cases
-            )   
-        )
+    data=data.copy(deep=_DEEP_COPY)
+    _ensure_occ_category(data)
+    data["Pressure"] = _pressure_values(
+        _float_values(data["Academic Pressure"]), _float_values(data["Work Pressure"]), *_occupation_masks(data)
     )
 
     return data 
 
+def _occupation_masks(data):
+    """
+    Boolean (is_student, is_professional) arrays for a frame with categorical occupation.
+    """
+
+    codes = _occupation_codes(data)
+    is_student = codes == _occupation_code(data, "Student")
+    is_professional = codes == _occupation_code(data, "Working Professional")
+    return is_student, is_professional
+
+def _pressure_values(academic, work, is_student, is_professional):
+    """
+    'Pressure' array from float arrays and precomputed occupation masks (see assign_pressure).
+    """
+
+    # One output buffer, overwritten in place: hybrids first, then each occupation
+    pressure = np.maximum(academic, work)  # Max for hybrids, NaN if either is missing
+    np.copyto(pressure, work, where=is_professional)
+    np.copyto(pressure, academic, where=is_student)
+    return pressure
+
+def _hybrid_mean(study, job):
+    """
+    Elementwise mean of two satisfaction arrays, evaluated with numexpr when installed.
+    """
+
+    if numexpr is not None:
+        return pd.eval("(study + job) * 0.5", local_dict={"study": study, "job": job}, engine="numexpr")
+    return (study + job) * 0.5
+
 def assign_satisfaction(data):
     """
     Create unified 'Satisfaction' feature from study/job satisfaction columns.
@@ -53,35 +170,94 @@ def assign_satisfaction(data):
     Args:
         data (pd.DataFrame):  
             Input dataframe containing:
-            - 'Working Professional or Student' (str): Occupation category
+            - 'Working Professional or Student' (str or category): Occupation category
             - 'Academic Satisfaction' (float): Student satisfaction (1-5 scale)
             - 'Work Satisfaction' (float): Professional satisfaction (1-5 scale)
 
     Returns:
         pd.DataFrame:
-            Original DataFrame with new 'Satisfaction' column (float, 1-5 scale)
-    """
-
-    data=data.copy()
-    is_student = data["Working Professional or Student"] == "Student"
-    is_professional = data["Working Professional or Student"] == "Working Professional"
-
-    data["Satisfaction"] = np.where(
-        is_student,
-        data["Study Satisfaction"],  
-        np.where(
-            is_professional,
-            data["Job Satisfaction"],  
-            np.where(
-                data["Study Satisfaction"].notna() & data["Job Satisfaction"].notna(),
-                data[["Study Satisfaction", "Job Satisfaction"]].mean(axis=1),  # Mean for hybrids
-                np.nan  # Fallback for edge cases
-            )   
-        )
+            Original DataFrame with new 'Satisfaction' column (float32 if inputs were downcast, 1-5 scale)
+    """
+
+    data=data.copy(deep=_DEEP_COPY)
+    _ensure_occ_category(data)
+    data["Satisfaction"] = _satisfaction_values(
+        _float_values(data["Study Satisfaction"]), _float_values(data["Job Satisfaction"]), *_occupation_masks(data)
+    )
+
+    return data 
+
+def _satisfaction_values(study, job, is_student, is_professional):
+    """
+    'Satisfaction' array from float arrays and precomputed occupation masks (see assign_satisfaction).
+    """
+
+    # One output buffer, overwritten in place: hybrids first, then each occupation
+    satisfaction = _hybrid_mean(study, job)  # Mean for hybrids, NaN if either is missing
+    np.copyto(satisfaction, job, where=is_professional)
+    np.copyto(satisfaction, study, where=is_student)
+    return satisfaction
+
+def apply_occupation_features(data):
+    """
+    Create both 'Pressure' and 'Satisfaction' in one step.
+
+    Equivalent to assign_satisfaction(assign_pressure(data)), but the
+    occupation masks are computed once and the frame is copied once.
+    Preferred in pipelines over the two separate steps.
+
+    Args:
+        data (pd.DataFrame):
+            Input dataframe with the occupation, pressure and satisfaction columns.
+
+    Returns:
+        pd.DataFrame:
+            Original DataFrame with new 'Pressure' and 'Satisfaction' columns
+    """
+
+    data=data.copy(deep=_DEEP_COPY)
+    _ensure_occ_category(data)
+    is_student, is_professional = _occupation_masks(data)
+    data["Pressure"] = _pressure_values(
+        _float_values(data["Academic Pressure"]), _float_values(data["Work Pressure"]),
+        is_student, is_professional
+    )
+    data["Satisfaction"] = _satisfaction_values(
+        _float_values(data["Study Satisfaction"]), _float_values(data["Job Satisfaction"]),
+        is_student, is_professional
     )
 
     return data 
 
+def _collapse_categories(series, dtype):
+    """
+    Collapse every value outside the kept categories of `dtype` into its last category.
+
+    Membership is resolved once per distinct value (a small code lookup table)
+    rather than once per row, and the result is built directly with the shared
+    `dtype`, so downstream encoders see identical categories on every call.
+
+    Args:
+        series (pd.Series):
+            Low-cardinality column to standardize.
+        dtype (pd.CategoricalDtype):
+            Kept categories followed by the catch-all label (also used for missing values).
+
+    Returns:
+        pd.Series:
+            Categorical series of `dtype`.
+    """
+
+    source = series.astype("category")
+    other_code = len(dtype.categories) - 1
+    # Maps source code -> output code; last slot catches code -1 (missing values)
+    lookup = np.full(len(source.cat.categories) + 1, other_code, dtype=np.int8)
+    kept = dtype.categories[:other_code].get_indexer(source.cat.categories)
+    lookup[:-1][kept >= 0] = kept[kept >= 0]
+
+    collapsed = pd.Categorical.from_codes(lookup[source.array.codes], dtype=dtype)
+    return pd.Series(collapsed, index=series.index, name=series.name)
+
 def replace_diet_habits(data):
     """
     Standardize 'Dietary Habits' by grouping rare categories into 'Other'.
@@ -92,17 +268,12 @@ def replace_diet_habits(data):
 
     Returns:
         pd.DataFrame:
-            Original DataFrame with standardized dietary categories:
+            Original DataFrame with standardized dietary categories (category dtype):
             - 'Healthy', 'Moderate', 'Unhealthy', or 'Other'
     """
      
-    data=data.copy()
-    top_categories = ["Moderate", "Unhealthy", "Healthy"]
-    data['Dietary Habits'] = np.where(
-        data['Dietary Habits'].isin(top_categories),
-        data['Dietary Habits'],  
-        'Other'                  
-    )
+    data=data.copy(deep=_DEEP_COPY)
+    data['Dietary Habits'] = _collapse_categories(data['Dietary Habits'], _DIET_DTYPE)
 
     return data 
 
@@ -116,17 +287,12 @@ def replace_sleep_duration(data):
 
     Returns:
         pd.DataFrame:
-            Original DataFrame with standardized sleep categories:
+            Original DataFrame with standardized sleep categories (category dtype):
             - 'Less than 5 hours', '5-6 hours', '7-8 hours', 'More than 8 hours', or 'other'
     """
      
-    data=data.copy()
-    top_categories = ["Less than 5 hours", "7-8 hours", "More than 8 hours", "5-6 hours"]
-    data["Sleep Duration"] = np.where(
-        data["Sleep Duration"].isin(top_categories),
-        data["Sleep Duration"],  
-        "other"                 
-    )
+    data=data.copy(deep=_DEEP_COPY)
+    data["Sleep Duration"] = _collapse_categories(data["Sleep Duration"], _SLEEP_DTYPE)
 
     return data 
 
@@ -142,9 +308,16 @@ class GroupImputer(BaseEstimator, TransformerMixin):
         cols_to_impute : list of str
             Column names to impute.
 
-        medians_ : dict
+        medians : dict
             Dictionary storing learned medians in format:
             {column_name: {'Student': median, 'Working Professional': median}}
+
+        categories_ : pd.Index
+            Occupation categories seen during fit.
+
+        medians_arr_ : dict
+            {column_name: np.ndarray} of medians indexed by fitted category
+            code, with a trailing NaN slot for missing occupations.
     """
 
     def __init__(self, cols_to_impute):
@@ -172,8 +345,46 @@ class GroupImputer(BaseEstimator, TransformerMixin):
                 Fitted imputer.
         """
 
+        occupation = X["Working Professional or Student"].astype("category")
+        codes = occupation.array.codes
+        observed = np.unique(codes[codes >= 0])
+        group_masks = [codes == code for code in observed]
+
+        # A couple of groups only: masked nanmedian beats the groupby machinery
+        medians = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # All-NaN group -> NaN median
+            for col in self.cols_to_impute:
+                values = X[col].to_numpy(dtype=np.float64)
+                medians[col] = [np.nanmedian(values[mask]) for mask in group_masks]
+
+        grouped = pd.DataFrame(medians, index=occupation.cat.categories[observed])
+        return self._store_medians(grouped, occupation.cat.categories)
+
+    def _store_medians(self, grouped, categories):
+        """
+        Record per-group medians as both the dict and the code-indexed arrays.
+
+        args:
+            grouped (pd.DataFrame):
+                Medians indexed by occupation, one column per imputed column.
+            categories (pd.Index):
+                Occupation categories the code-indexed arrays are laid out by.
+
+        Returns:
+            self:
+                Fitted imputer.
+        """
+
+        self.categories_ = pd.Index(categories)
+
+        # Dense lookup by fitted category code, plus a trailing NaN slot for code -1
+        self.medians_arr_ = {}
         for col in self.cols_to_impute:
-            self.medians[col] = X.groupby("Working Professional or Student")[col].median().to_dict()
+            self.medians[col] = grouped[col].to_dict()
+            self.medians_arr_[col] = np.append(
+                grouped[col].reindex(self.categories_).to_numpy(dtype=np.float64), np.nan
+            )
         return self
     
     def transform(self, X):
@@ -189,13 +400,66 @@ class GroupImputer(BaseEstimator, TransformerMixin):
                 Transformed data with missing values imputed.
         """
         
-        X = X.copy()
+        X = X.copy(deep=_DEEP_COPY)
+        _ensure_occ_category(X)
+        codes = _occupation_codes(X)
         for col in self.cols_to_impute: 
-            missing_mask = X[col].isna()
-            for group, median_val in self.medians[col].items():
-                group_mask = (X["Working Professional or Student"] == group) & missing_mask
-                X.loc[group_mask, col] = median_val
+            missing_mask = X[col].isna().to_numpy()
+            if not missing_mask.any():
+                continue
+
+            values = _float_values(X[col])
+            fills = self._median_table(X, col).astype(values.dtype)[codes]
+            X[col] = np.where(missing_mask, fills, values)
         return X
+
+    def _transform_arrays(self, arrays):
+        """
+        Apply learned median imputation to a dict of column arrays (no pandas objects).
+
+        args:
+            arrays (dict of str -> np.ndarray):
+                Column arrays, including 'Working Professional or Student' labels.
+
+        Returns:
+            dict of str -> np.ndarray:
+                New dict with the imputed columns replaced; inputs are not modified.
+        """
+
+        arrays = dict(arrays)
+        # Row -> fitted category code; -1 (unseen/missing) hits the trailing NaN slot
+        fitted_codes = self.categories_.get_indexer(arrays["Working Professional or Student"])
+        for col in self.cols_to_impute:
+            values = _float_values(arrays[col])
+            missing_mask = np.isnan(values)
+            if missing_mask.any():
+                fills = self.medians_arr_[col].astype(values.dtype)[fitted_codes]
+                arrays[col] = np.where(missing_mask, fills, values)
+        return arrays
+
+    def _median_table(self, X, col):
+        """
+        Lay out the learned medians of `col` by X's occupation category code.
+
+        args:
+            X (pd.DataFrame):
+                Data with a categorical 'Working Professional or Student' column.
+            col (str):
+                Imputed column name.
+
+        Returns:
+            np.ndarray:
+                Medians indexed by category code; the last slot (code -1) and
+                groups unseen during fit hold NaN.
+        """
+
+        categories = X["Working Professional or Student"].cat.categories
+        if col not in self.medians_arr_:
+            return np.full(len(categories) + 1, np.nan)
+
+        # Map X's codes onto fitted codes; -1 (unseen/missing) hits the NaN slot
+        fitted_codes = np.append(self.categories_.get_indexer(categories), -1)
+        return self.medians_arr_[col][fitted_codes]
     
 def add_pressure_ratio(X):
     """Add Pressure/Satisfaction ratio feature with epsilon to avoid division by zero
@@ -208,6 +472,233 @@ def add_pressure_ratio(X):
         pd.DataFrame:
             Transformed data with Pressure/Satisfaction ratio
     """
-    X = X.copy()
-    X["Pressure_Satisfaction_Ratio"] = X["Pressure"] / (X["Satisfaction"] + 1e-6)
-    return X
\ No newline at end of file
+    X = X.copy(deep=_DEEP_COPY)
+    X["Pressure_Satisfaction_Ratio"] = add_pressure_ratio_arrays(X["Pressure"], X["Satisfaction"])
+    return X
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _numeric_features_kernel(codes, student_code, professional_code,
+                                 academic, work, study, job,
+                                 pressure_medians, satisfaction_medians):
+        """Single pass over rows computing imputed Pressure, Satisfaction and their ratio."""
+
+        n = codes.shape[0]
+        # Outputs follow the input dtype, so downcast float32 columns stay float32
+        pressure = np.empty_like(academic)
+        satisfaction = np.empty_like(study)
+        ratio = np.empty_like(study)
+        for i in prange(n):
+            code = codes[i]
+            if code == student_code:
+                p = academic[i]
+                s = study[i]
+            elif code == professional_code:
+                p = work[i]
+                s = job[i]
+            else:
+                if np.isnan(academic[i]) or np.isnan(work[i]):
+                    p = np.nan
+                else:
+                    p = max(academic[i], work[i])  # Max for hybrids
+                if np.isnan(study[i]) or np.isnan(job[i]):
+                    s = np.nan
+                else:
+                    s = (study[i] + job[i]) * 0.5  # Mean for hybrids
+
+            # Code -1 (missing occupation) reads the NaN slot at the end of the tables
+            if np.isnan(p):
+                p = pressure_medians[code]
+            if np.isnan(s):
+                s = satisfaction_medians[code]
+
+            pressure[i] = p
+            satisfaction[i] = s
+            ratio[i] = p / (s + 1e-6)
+        return pressure, satisfaction, ratio
+
+def add_numeric_features(data, imputer):
+    """
+    Fused equivalent of apply_occupation_features -> imputer -> add_pressure_ratio.
+
+    With numba installed, Pressure, Satisfaction (imputed when listed in the
+    imputer's columns) and Pressure_Satisfaction_Ratio are computed by one
+    compiled kernel in a single pass over the rows; other imputed columns are
+    then filled by the imputer as usual. Without numba, the numpy steps are
+    chained instead. Outputs keep float32 if the inputs were downcast.
+
+    Args:
+        data (pd.DataFrame):
+            Input dataframe with the raw pressure/satisfaction and occupation columns.
+        imputer (GroupImputer):
+            Imputer already fitted on the output of apply_occupation_features.
+
+    Returns:
+        pd.DataFrame:
+            DataFrame with 'Pressure', 'Satisfaction' and 'Pressure_Satisfaction_Ratio' columns
+    """
+
+    if njit is None:
+        return add_pressure_ratio(imputer.transform(apply_occupation_features(data)))
+
+    data = data.copy(deep=_DEEP_COPY)
+    _ensure_occ_category(data)
+    academic = _float_values(data["Academic Pressure"])
+    study = _float_values(data["Study Satisfaction"])
+    pressure, satisfaction, ratio = _numeric_features_kernel(
+        _occupation_codes(data),
+        _occupation_code(data, "Student"),
+        _occupation_code(data, "Working Professional"),
+        academic,
+        _float_values(data["Work Pressure"]).astype(academic.dtype, copy=False),
+        study,
+        _float_values(data["Job Satisfaction"]).astype(study.dtype, copy=False),
+        imputer._median_table(data, "Pressure").astype(academic.dtype),
+        imputer._median_table(data, "Satisfaction").astype(study.dtype),
+    )
+    data["Pressure"] = pressure
+    data["Satisfaction"] = satisfaction
+    data = imputer.transform(data)  # Remaining columns; the two above are already filled
+    data["Pressure_Satisfaction_Ratio"] = ratio
+    return data
+
+def _label_masks(occupation):
+    """
+    Boolean (is_student, is_professional) arrays from raw occupation labels.
+    """
+
+    occupation = np.asarray(occupation, dtype=object)
+    return occupation == "Student", occupation == "Working Professional"
+
+def assign_pressure_arrays(occupation, academic, work):
+    """
+    Array counterpart of assign_pressure, for callers holding raw column arrays.
+
+    Args:
+        occupation (np.ndarray): 'Working Professional or Student' labels.
+        academic (np.ndarray): 'Academic Pressure' values.
+        work (np.ndarray): 'Work Pressure' values.
+
+    Returns:
+        np.ndarray:
+            'Pressure' values (float32 if inputs were float32, 1-5 scale)
+    """
+
+    return _pressure_values(_float_values(academic), _float_values(work), *_label_masks(occupation))
+
+def assign_satisfaction_arrays(occupation, study, job):
+    """
+    Array counterpart of assign_satisfaction, for callers holding raw column arrays.
+
+    Args:
+        occupation (np.ndarray): 'Working Professional or Student' labels.
+        study (np.ndarray): 'Study Satisfaction' values.
+        job (np.ndarray): 'Job Satisfaction' values.
+
+    Returns:
+        np.ndarray:
+            'Satisfaction' values (float32 if inputs were float32, 1-5 scale)
+    """
+
+    return _satisfaction_values(_float_values(study), _float_values(job), *_label_masks(occupation))
+
+def add_pressure_ratio_arrays(pressure, satisfaction):
+    """
+    Array counterpart of add_pressure_ratio (epsilon avoids division by zero).
+
+    Args:
+        pressure (np.ndarray or pd.Series): 'Pressure' values.
+        satisfaction (np.ndarray or pd.Series): 'Satisfaction' values.
+
+    Returns:
+        np.ndarray:
+            'Pressure_Satisfaction_Ratio' values
+    """
+
+    pressure = _float_values(pressure)
+    satisfaction = _float_values(satisfaction)
+
+    if numexpr is not None:
+        # One multithreaded pass, no intermediate array
+        return pd.eval(
+            "pressure / (satisfaction + 1e-6)",
+            local_dict={"pressure": pressure, "satisfaction": satisfaction},
+            engine="numexpr"
+        )
+    # Single output buffer: add the epsilon into it, then divide in place
+    ratio = np.add(satisfaction, 1e-6, dtype=np.result_type(pressure, satisfaction))
+    np.divide(pressure, ratio, out=ratio)
+    return ratio
+
+def _collapse_labels(values, dtype):
+    """
+    Array counterpart of _collapse_categories, returning an object array of labels.
+    """
+
+    other_code = len(dtype.categories) - 1
+    codes = dtype.categories[:other_code].get_indexer(np.asarray(values, dtype=object))
+    codes[codes < 0] = other_code  # Rare and missing values
+    return np.asarray(dtype.categories, dtype=object)[codes]
+
+def replace_diet_habits_arrays(diet):
+    """
+    Array counterpart of replace_diet_habits.
+
+    Args:
+        diet (np.ndarray): 'Dietary Habits' labels.
+
+    Returns:
+        np.ndarray:
+            'Healthy', 'Moderate', 'Unhealthy', or 'Other' labels (object dtype)
+    """
+
+    return _collapse_labels(diet, _DIET_DTYPE)
+
+def replace_sleep_duration_arrays(sleep):
+    """
+    Array counterpart of replace_sleep_duration.
+
+    Args:
+        sleep (np.ndarray): 'Sleep Duration' labels.
+
+    Returns:
+        np.ndarray:
+            'Less than 5 hours', '5-6 hours', '7-8 hours', 'More than 8 hours', or 'other' labels (object dtype)
+    """
+
+    return _collapse_labels(sleep, _SLEEP_DTYPE)
+
+def preprocess_arrays(arrays, imputer):
+    """
+    Pandas-free fast path of the preprocessing steps for batch scoring.
+
+    Runs apply_occupation_features -> imputer -> add_pressure_ratio ->
+    replace_diet_habits -> replace_sleep_duration directly on column arrays,
+    skipping all DataFrame/Series construction and indexing.
+
+    Args:
+        arrays (dict of str -> np.ndarray):
+            Raw column arrays keyed by column name.
+        imputer (GroupImputer):
+            Fitted imputer.
+
+    Returns:
+        dict of str -> np.ndarray:
+            New dict with the engineered and standardized columns added/replaced.
+    """
+
+    arrays = dict(arrays)
+    is_student, is_professional = _label_masks(arrays["Working Professional or Student"])
+    arrays["Pressure"] = _pressure_values(
+        _float_values(arrays["Academic Pressure"]), _float_values(arrays["Work Pressure"]),
+        is_student, is_professional
+    )
+    arrays["Satisfaction"] = _satisfaction_values(
+        _float_values(arrays["Study Satisfaction"]), _float_values(arrays["Job Satisfaction"]),
+        is_student, is_professional
+    )
+    arrays = imputer._transform_arrays(arrays)
+    arrays["Pressure_Satisfaction_Ratio"] = add_pressure_ratio_arrays(arrays["Pressure"], arrays["Satisfaction"])
+    arrays["Dietary Habits"] = replace_diet_habits_arrays(arrays["Dietary Habits"])
+    arrays["Sleep Duration"] = replace_sleep_duration_arrays(arrays["Sleep Duration"])
+    return arrays
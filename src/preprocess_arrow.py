@@ -0,0 +1,267 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from sklearn.base import BaseEstimator, TransformerMixin
+
+def _column(table, name, dtype=None):
+    """
+    Column of `table` as a ChunkedArray, dictionary-decoded and optionally cast.
+    """
+
+    column = table[name]
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    return column.cast(dtype) if dtype is not None else column
+
+def _set_column(table, name, values):
+    """
+    Replace column `name` of `table` (or append it if missing).
+    """
+
+    index = table.schema.get_field_index(name)
+    if index == -1:
+        return table.append_column(name, values)
+    return table.set_column(index, name, values)
+
+def _occupation_masks(table):
+    """
+    Null-free (is_student, is_professional) boolean arrays.
+    """
+
+    occupation = _column(table, "Working Professional or Student", pa.string())
+    is_student = pc.fill_null(pc.equal(occupation, "Student"), False)
+    is_professional = pc.fill_null(pc.equal(occupation, "Working Professional"), False)
+    return is_student, is_professional
+
+def assign_pressure(table):
+    """
+    Create unified 'Pressure' feature from academic/work pressure columns based on occupation.
+
+    Arrow counterpart of preprocess.assign_pressure:
+    For students: Uses 'Academic Pressure'
+    For professionals: Uses 'Work Pressure'
+    For others: Uses maximum of both pressure values, or null if either is missing
+
+    Args:
+        table (pa.Table):
+            Input table containing 'Working Professional or Student',
+            'Academic Pressure' and 'Work Pressure'.
+
+    Returns:
+        pa.Table:
+            Table with new 'Pressure' column (float, 1-5 scale)
+    """
+
+    is_student, is_professional = _occupation_masks(table)
+    academic = _column(table, "Academic Pressure", pa.float64())
+    work = _column(table, "Work Pressure", pa.float64())
+
+    pressure = pc.if_else(
+        is_student,
+        academic,
+        pc.if_else(
+            is_professional,
+            work,
+            pc.max_element_wise(academic, work, skip_nulls=False)  # Max for hybrids, null if either is missing
+        )
+    )
+    return _set_column(table, "Pressure", pressure)
+
+def assign_satisfaction(table):
+    """
+    Create unified 'Satisfaction' feature from study/job satisfaction columns.
+
+    Arrow counterpart of preprocess.assign_satisfaction:
+    For students: Uses 'Study Satisfaction'
+    For professionals: Uses 'Job Satisfaction'
+    For others: Uses average of both satisfaction values, or null if either is missing
+
+    Args:
+        table (pa.Table):
+            Input table containing 'Working Professional or Student',
+            'Study Satisfaction' and 'Job Satisfaction'.
+
+    Returns:
+        pa.Table:
+            Table with new 'Satisfaction' column (float, 1-5 scale)
+    """
+
+    is_student, is_professional = _occupation_masks(table)
+    study = _column(table, "Study Satisfaction", pa.float64())
+    job = _column(table, "Job Satisfaction", pa.float64())
+
+    satisfaction = pc.if_else(
+        is_student,
+        study,
+        pc.if_else(
+            is_professional,
+            job,
+            pc.multiply(pc.add(study, job), 0.5)  # Mean for hybrids, null if either is missing
+        )
+    )
+    return _set_column(table, "Satisfaction", satisfaction)
+
+def _collapse_categories(table, name, top_categories, other):
+    """
+    Map values of column `name` outside `top_categories` (and nulls) to `other`.
+    """
+
+    column = _column(table, name, pa.string())
+    keep = pc.is_in(column, value_set=pa.array(top_categories))  # False for nulls
+    return _set_column(table, name, pc.if_else(keep, column, pa.scalar(other)))
+
+def replace_diet_habits(table):
+    """
+    Standardize 'Dietary Habits' by grouping rare categories into 'Other'.
+
+    Args:
+        table (pa.Table):
+            Input table containing 'Dietary Habits' column.
+
+    Returns:
+        pa.Table:
+            Table with standardized dietary categories:
+            - 'Healthy', 'Moderate', 'Unhealthy', or 'Other'
+    """
+
+    top_categories = ["Moderate", "Unhealthy", "Healthy"]
+    return _collapse_categories(table, "Dietary Habits", top_categories, "Other")
+
+def replace_sleep_duration(table):
+    """
+    Standardize 'Sleep Duration' by grouping rare categories into 'other'
+
+    Args:
+        table (pa.Table):
+            Input table containing 'Sleep Duration' column.
+
+    Returns:
+        pa.Table:
+            Table with standardized sleep categories:
+            - 'Less than 5 hours', '5-6 hours', '7-8 hours', 'More than 8 hours', or 'other'
+    """
+
+    top_categories = ["Less than 5 hours", "7-8 hours", "More than 8 hours", "5-6 hours"]
+    return _collapse_categories(table, "Sleep Duration", top_categories, "other")
+
+class GroupImputer(BaseEstimator, TransformerMixin):
+    """
+    Arrow counterpart of preprocess.GroupImputer (group-wise median imputation).
+
+    Arrow's group_by only offers approximate medians, so exact medians are
+    taken per group with pc.quantile on filtered columns.
+
+    Attributes:
+        cols_to_impute : list of str
+            Column names to impute.
+
+        medians : dict
+            Dictionary storing learned medians in format:
+            {column_name: {'Student': median, 'Working Professional': median}}
+    """
+
+    def __init__(self, cols_to_impute):
+        """
+        Initialize the imputer with columns to process.
+
+        args:
+            cols_to_impute : list of str
+                Column names to impute.
+        """
+
+        self.cols_to_impute = cols_to_impute
+        self.medians = {} # storage for learned values
+
+    def fit(self, X):
+        """
+        Learn median values for each group (students/professionals).
+
+        args:
+            X (pa.Table):
+                Training data containing subset columns and 'Working Professional or Student'.
+
+        Returns:
+            self:
+                Fitted imputer.
+        """
+
+        occupation = _column(X, "Working Professional or Student", pa.string())
+        groups = pc.unique(occupation.drop_null()).to_pylist()
+        group_masks = {group: pc.equal(occupation, group) for group in groups}
+        for col in self.cols_to_impute:
+            values = _column(X, col, pa.float64())
+            self.medians[col] = {
+                group: pc.quantile(pc.filter(values, mask), q=0.5)[0].as_py()
+                for group, mask in group_masks.items()
+            }
+        return self
+
+    def transform(self, X):
+        """
+        Apply learned median imputation to the data.
+
+        args:
+            X (pa.Table):
+                Data to transform.
+
+        Returns:
+            pa.Table:
+                Table with missing values imputed.
+        """
+
+        occupation = _column(X, "Working Professional or Student", pa.string())
+        for col in self.cols_to_impute:
+            groups = list(self.medians[col])
+            # Row -> position of its group in the learned medians (null if unseen)
+            positions = pc.index_in(occupation, value_set=pa.array(groups, type=pa.string()))
+            fills = pc.take(pa.array([self.medians[col][group] for group in groups], type=pa.float64()), positions)
+            X = _set_column(X, col, pc.coalesce(_column(X, col, pa.float64()), fills))
+        return X
+
+def add_pressure_ratio(X):
+    """Add Pressure/Satisfaction ratio feature with epsilon to avoid division by zero
+
+    args:
+        X (pa.Table):
+            Data to transform.
+
+    Returns:
+        pa.Table:
+            Transformed data with Pressure/Satisfaction ratio
+    """
+
+    ratio = pc.divide(X["Pressure"], pc.add(X["Satisfaction"], 1e-6))
+    return _set_column(X, "Pressure_Satisfaction_Ratio", ratio)
+
+def preprocess(data, imputer):
+    """
+    Run every preprocessing step on Arrow buffers, converting to pandas once at the end.
+
+    Args:
+        data (pd.DataFrame or pa.Table):
+            Raw input data.
+        imputer (GroupImputer):
+            Imputer fitted on `assign_satisfaction(assign_pressure(train_table))`.
+
+    Returns:
+        pd.DataFrame:
+            Preprocessed data, before column dropping and encoding. A pandas
+            input's index is kept, so index-aligned joins with labels still line up.
+    """
+
+    table = pa.Table.from_pandas(data, preserve_index=False) if isinstance(data, pd.DataFrame) else data
+    steps = [
+        assign_pressure,
+        assign_satisfaction,
+        imputer.transform,
+        add_pressure_ratio,
+        replace_diet_habits,
+        replace_sleep_duration,
+    ]
+    for step in steps:
+        table = step(table)
+
+    result = table.to_pandas()
+    if isinstance(data, pd.DataFrame):
+        result = result.set_axis(data.index)
+    return result
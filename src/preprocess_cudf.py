@@ -0,0 +1,227 @@
+"""
+Experimental cuDF (GPU) backend for the preprocessing steps.
+
+The GPU branches have not been run against a real GPU yet; only the CPU
+fallback (pandas input, or cuDF not installed) is exercised.
+"""
+
+import preprocess
+
+try:
+    import cudf
+except ImportError:  # Optional: every step falls back to the CPU code in preprocess
+    cudf = None
+
+def _on_gpu(data):
+    """True if `data` is a cuDF DataFrame (and cuDF is installed)."""
+    return cudf is not None and isinstance(data, cudf.DataFrame)
+
+def _occupation_masks(data):
+    """Null-free (is_student, is_professional) boolean Series."""
+    occupation = data["Working Professional or Student"]
+    return (occupation == "Student").fillna(False), (occupation == "Working Professional").fillna(False)
+
+def _gpu_assign_pressure(data):
+    is_student, is_professional = _occupation_masks(data)
+    academic = data["Academic Pressure"]
+    work = data["Work Pressure"]
+
+    # Max for hybrids, missing if either is missing
+    hybrid = academic.where(academic >= work, work).where(academic.notna() & work.notna())
+    data = data.copy(deep=False)
+    data["Pressure"] = academic.where(is_student, work.where(is_professional, hybrid))
+    return data
+
+def _gpu_assign_satisfaction(data):
+    is_student, is_professional = _occupation_masks(data)
+    study = data["Study Satisfaction"]
+    job = data["Job Satisfaction"]
+
+    hybrid = (study + job) * 0.5  # Mean for hybrids, missing if either is missing
+    data = data.copy(deep=False)
+    data["Satisfaction"] = study.where(is_student, job.where(is_professional, hybrid))
+    return data
+
+def _gpu_collapse_categories(series, dtype):
+    other = dtype.categories[-1]
+    # Plain strings first: where() on a categorical cannot introduce the catch-all label
+    series = series.astype("str")
+    kept = series.isin(list(dtype.categories[:-1]))  # False for missing values
+    return series.where(kept, other).astype(cudf.CategoricalDtype.from_pandas(dtype))
+
+def assign_pressure(data):
+    """
+    Create unified 'Pressure' feature (see preprocess.assign_pressure) on GPU.
+
+    Args:
+        data (cudf.DataFrame or pd.DataFrame):
+            Input data; pandas frames use the CPU implementation.
+
+    Returns:
+        cudf.DataFrame or pd.DataFrame:
+            Same frame type with new 'Pressure' column (float, 1-5 scale)
+    """
+
+    if not _on_gpu(data):
+        return preprocess.assign_pressure(data)
+    return _gpu_assign_pressure(data)
+
+def assign_satisfaction(data):
+    """
+    Create unified 'Satisfaction' feature (see preprocess.assign_satisfaction) on GPU.
+
+    Args:
+        data (cudf.DataFrame or pd.DataFrame):
+            Input data; pandas frames use the CPU implementation.
+
+    Returns:
+        cudf.DataFrame or pd.DataFrame:
+            Same frame type with new 'Satisfaction' column (float, 1-5 scale)
+    """
+
+    if not _on_gpu(data):
+        return preprocess.assign_satisfaction(data)
+    return _gpu_assign_satisfaction(data)
+
+def replace_diet_habits(data):
+    """
+    Standardize 'Dietary Habits' (see preprocess.replace_diet_habits) on GPU.
+
+    Args:
+        data (cudf.DataFrame or pd.DataFrame):
+            Input data; pandas frames use the CPU implementation.
+
+    Returns:
+        cudf.DataFrame or pd.DataFrame:
+            Same frame type with 'Healthy', 'Moderate', 'Unhealthy', or 'Other' categories
+    """
+
+    if not _on_gpu(data):
+        return preprocess.replace_diet_habits(data)
+    data = data.copy(deep=False)
+    data["Dietary Habits"] = _gpu_collapse_categories(data["Dietary Habits"], preprocess._DIET_DTYPE)
+    return data
+
+def replace_sleep_duration(data):
+    """
+    Standardize 'Sleep Duration' (see preprocess.replace_sleep_duration) on GPU.
+
+    Args:
+        data (cudf.DataFrame or pd.DataFrame):
+            Input data; pandas frames use the CPU implementation.
+
+    Returns:
+        cudf.DataFrame or pd.DataFrame:
+            Same frame type with 'Less than 5 hours', '5-6 hours', '7-8 hours',
+            'More than 8 hours', or 'other' categories
+    """
+
+    if not _on_gpu(data):
+        return preprocess.replace_sleep_duration(data)
+    data = data.copy(deep=False)
+    data["Sleep Duration"] = _gpu_collapse_categories(data["Sleep Duration"], preprocess._SLEEP_DTYPE)
+    return data
+
+def add_pressure_ratio(X):
+    """Add Pressure/Satisfaction ratio feature (see preprocess.add_pressure_ratio) on GPU
+
+    args:
+        X (cudf.DataFrame or pd.DataFrame):
+            Data to transform; pandas frames use the CPU implementation.
+
+    Returns:
+        cudf.DataFrame or pd.DataFrame:
+            Transformed data with Pressure/Satisfaction ratio
+    """
+
+    if not _on_gpu(X):
+        return preprocess.add_pressure_ratio(X)
+    X = X.copy(deep=False)
+    X["Pressure_Satisfaction_Ratio"] = X["Pressure"] / (X["Satisfaction"] + 1e-6)
+    return X
+
+class GroupImputer(preprocess.GroupImputer):
+    """
+    preprocess.GroupImputer that also fits and transforms cuDF DataFrames.
+
+    Medians are learned with a GPU groupby and replayed with one GPU gather
+    per column; pandas inputs go through the CPU implementation unchanged.
+    """
+
+    def fit(self, X):
+        """
+        Learn median values for each group (students/professionals).
+
+        args:
+            X (cudf.DataFrame or pd.DataFrame):
+                Training data containing subset columns and 'Working Professional or Student'.
+
+        Returns:
+            self:
+                Fitted imputer.
+        """
+
+        if not _on_gpu(X):
+            return super().fit(X)
+        grouped = X.groupby("Working Professional or Student")[self.cols_to_impute].median().to_pandas()
+        grouped = grouped.sort_index()
+        return self._store_medians(grouped, list(grouped.index))
+
+    def transform(self, X):
+        """
+        Apply learned median imputation to the data.
+
+        args:
+            X (cudf.DataFrame or pd.DataFrame):
+                Data to transform.
+
+        Returns:
+            cudf.DataFrame or pd.DataFrame:
+                Same frame type with missing values imputed.
+        """
+
+        if not _on_gpu(X):
+            return super().transform(X)
+        X = X.copy(deep=False)
+        occupation = X["Working Professional or Student"].astype("str")
+        for col in self.cols_to_impute:
+            # One gather per column: occupation -> learned median (missing if unseen)
+            X[col] = X[col].fillna(occupation.map(self.medians[col]))
+        return X
+
+def preprocess_frame(data, imputer, use_gpu=True):
+    """
+    Run every preprocessing step on GPU when cuDF is available, else on CPU.
+
+    Args:
+        data (pd.DataFrame or cudf.DataFrame):
+            Raw input data; pandas frames are copied to the GPU once.
+        imputer (GroupImputer):
+            Imputer fitted on `assign_satisfaction(assign_pressure(train))`
+            (either a cuDF or a pandas training frame).
+        use_gpu (bool):
+            Set False to force the CPU path.
+
+    Returns:
+        pd.DataFrame or cudf.DataFrame:
+            Preprocessed data, before column dropping and encoding. pandas
+            input comes back as pandas; cuDF input processed on GPU stays on GPU.
+    """
+
+    if not use_gpu and _on_gpu(data):
+        data = data.to_pandas()
+    to_gpu = use_gpu and cudf is not None and not _on_gpu(data)
+    if to_gpu:
+        data = cudf.from_pandas(data)
+
+    steps = [
+        assign_pressure,
+        assign_satisfaction,
+        imputer.transform,
+        add_pressure_ratio,
+        replace_diet_habits,
+        replace_sleep_duration,
+    ]
+    for step in steps:
+        data = step(data)
+    return data.to_pandas() if to_gpu else data
@@ -0,0 +1,120 @@
+import os
+
+from dask import dataframe as dd
+
+import preprocess
+
+def to_dask(data, npartitions=None):
+    """
+    Split a pandas DataFrame into Dask partitions, one per CPU core by default.
+
+    Rows keep their input order (no index sort), so results line up
+    positionally with labels split alongside the features.
+
+    Args:
+        data (pd.DataFrame or dd.DataFrame):
+            Input data; Dask frames are returned unchanged.
+        npartitions (int, optional):
+            Number of partitions. Defaults to os.cpu_count().
+
+    Returns:
+        dd.DataFrame:
+            Partitioned DataFrame.
+    """
+
+    if isinstance(data, dd.DataFrame):
+        return data
+    return dd.from_pandas(data, npartitions=npartitions or os.cpu_count() or 1, sort=False)
+
+def assign_pressure(data):
+    """Partition-wise preprocess.assign_pressure."""
+    return data.map_partitions(preprocess.assign_pressure)
+
+def assign_satisfaction(data):
+    """Partition-wise preprocess.assign_satisfaction."""
+    return data.map_partitions(preprocess.assign_satisfaction)
+
+def replace_diet_habits(data):
+    """Partition-wise preprocess.replace_diet_habits."""
+    return data.map_partitions(preprocess.replace_diet_habits)
+
+def replace_sleep_duration(data):
+    """Partition-wise preprocess.replace_sleep_duration."""
+    return data.map_partitions(preprocess.replace_sleep_duration)
+
+def add_pressure_ratio(X):
+    """Partition-wise preprocess.add_pressure_ratio."""
+    return X.map_partitions(preprocess.add_pressure_ratio)
+
+class GroupImputer(preprocess.GroupImputer):
+    """
+    Dask variant of preprocess.GroupImputer.
+
+    Medians are learned with one distributed groupby over all partitions, then
+    broadcast to every partition through the pandas `transform`.
+    """
+
+    def fit(self, X):
+        """
+        Learn median values for each group (students/professionals).
+
+        args:
+            X (dd.DataFrame):
+                Training data containing subset columns and 'Working Professional or Student'.
+
+        Returns:
+            self:
+                Fitted imputer.
+        """
+
+        grouped = (
+            X.groupby("Working Professional or Student", observed=True)[self.cols_to_impute]
+            .median()
+            .compute()
+        )
+        return self._store_medians(grouped, list(grouped.index))
+
+    def transform(self, X):
+        """
+        Apply learned median imputation to every partition.
+
+        args:
+            X (dd.DataFrame):
+                Data to transform.
+
+        Returns:
+            dd.DataFrame:
+                Lazily transformed data with missing values imputed.
+        """
+
+        return X.map_partitions(super().transform)
+
+def preprocess_frame(data, imputer, npartitions=None):
+    """
+    Run every preprocessing step as one lazy Dask graph and compute it.
+
+    Args:
+        data (pd.DataFrame or dd.DataFrame):
+            Raw input data.
+        imputer (GroupImputer):
+            Imputer fitted on `assign_satisfaction(assign_pressure(to_dask(train)))`.
+        npartitions (int, optional):
+            Number of partitions when `data` is a pandas DataFrame.
+
+    Returns:
+        pd.DataFrame:
+            Preprocessed data, before column dropping and encoding.
+    """
+
+    steps = [
+        assign_pressure,
+        assign_satisfaction,
+        imputer.transform,
+        add_pressure_ratio,
+        replace_diet_habits,
+        replace_sleep_duration,
+    ]
+    ddf = to_dask(data, npartitions)
+    for step in steps:
+        ddf = step(ddf)
+    return ddf.compute()
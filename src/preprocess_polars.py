@@ -0,0 +1,232 @@
+import polars as pl
+from sklearn.base import BaseEstimator, TransformerMixin
+
+def assign_pressure(data):
+    """
+    Create unified 'Pressure' feature from academic/work pressure columns based on occupation.
+
+    Polars counterpart of preprocess.assign_pressure:
+    For students: Uses 'Academic Pressure'
+    For professionals: Uses 'Work Pressure'
+    For others: Uses maximum of both pressure values, or null if either is missing
+
+    Args:
+        data (pl.DataFrame or pl.LazyFrame):
+            Input frame containing 'Working Professional or Student',
+            'Academic Pressure' and 'Work Pressure'.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame:
+            Same frame type with new 'Pressure' column (float, 1-5 scale)
+    """
+
+    occupation = pl.col("Working Professional or Student")
+    academic = pl.col("Academic Pressure")
+    work = pl.col("Work Pressure")
+
+    return data.with_columns(
+        pl.when(occupation == "Student").then(academic)
+        .when(occupation == "Working Professional").then(work)
+        .when(academic.is_not_null() & work.is_not_null()).then(pl.max_horizontal(academic, work))  # Max for hybrids
+        .otherwise(None)  # Fallback for edge cases
+        .cast(pl.Float64)
+        .alias("Pressure")
+    )
+
+def assign_satisfaction(data):
+    """
+    Create unified 'Satisfaction' feature from study/job satisfaction columns.
+
+    Polars counterpart of preprocess.assign_satisfaction:
+    For students: Uses 'Study Satisfaction'
+    For professionals: Uses 'Job Satisfaction'
+    For others: Uses average of both satisfaction values, or null if either is missing
+
+    Args:
+        data (pl.DataFrame or pl.LazyFrame):
+            Input frame containing 'Working Professional or Student',
+            'Study Satisfaction' and 'Job Satisfaction'.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame:
+            Same frame type with new 'Satisfaction' column (float, 1-5 scale)
+    """
+
+    occupation = pl.col("Working Professional or Student")
+    study = pl.col("Study Satisfaction")
+    job = pl.col("Job Satisfaction")
+
+    return data.with_columns(
+        pl.when(occupation == "Student").then(study)
+        .when(occupation == "Working Professional").then(job)
+        .otherwise((study + job) * 0.5)  # Mean for hybrids, null if either is missing
+        .cast(pl.Float64)
+        .alias("Satisfaction")
+    )
+
+def _collapse_categories(column, top_categories, other):
+    """
+    Expression mapping values outside `top_categories` (and nulls) to `other`, as an Enum.
+    """
+
+    return (
+        pl.when(pl.col(column).is_in(top_categories)).then(pl.col(column))
+        .otherwise(pl.lit(other))
+        .cast(pl.Enum(top_categories + [other]))
+        .alias(column)
+    )
+
+def replace_diet_habits(data):
+    """
+    Standardize 'Dietary Habits' by grouping rare categories into 'Other'.
+
+    Args:
+        data (pl.DataFrame or pl.LazyFrame):
+            Input frame containing 'Dietary Habits' column.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame:
+            Same frame type with standardized dietary categories (Enum dtype):
+            - 'Healthy', 'Moderate', 'Unhealthy', or 'Other'
+    """
+
+    top_categories = ["Moderate", "Unhealthy", "Healthy"]
+    return data.with_columns(_collapse_categories("Dietary Habits", top_categories, "Other"))
+
+def replace_sleep_duration(data):
+    """
+    Standardize 'Sleep Duration' by grouping rare categories into 'other'
+
+    Args:
+        data (pl.DataFrame or pl.LazyFrame):
+            Input frame containing 'Sleep Duration' column.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame:
+            Same frame type with standardized sleep categories (Enum dtype):
+            - 'Less than 5 hours', '5-6 hours', '7-8 hours', 'More than 8 hours', or 'other'
+    """
+
+    top_categories = ["Less than 5 hours", "7-8 hours", "More than 8 hours", "5-6 hours"]
+    return data.with_columns(_collapse_categories("Sleep Duration", top_categories, "other"))
+
+class GroupImputer(BaseEstimator, TransformerMixin):
+    """
+    Polars counterpart of preprocess.GroupImputer (group-wise median imputation).
+
+    Medians are learned once in `fit` and replayed in `transform`, so
+    validation/test frames are imputed with training statistics.
+
+    Attributes:
+        cols_to_impute : list of str
+            Column names to impute.
+
+        medians : dict
+            Dictionary storing learned medians in format:
+            {column_name: {'Student': median, 'Working Professional': median}}
+    """
+
+    def __init__(self, cols_to_impute):
+        """
+        Initialize the imputer with columns to process.
+
+        args:
+            cols_to_impute : list of str
+                Column names to impute.
+        """
+
+        self.cols_to_impute = cols_to_impute
+        self.medians = {} # storage for learned values
+
+    def fit(self, X):
+        """
+        Learn median values for each group (students/professionals).
+
+        args:
+            X (pl.DataFrame or pl.LazyFrame):
+                Training data containing subset columns and 'Working Professional or Student'.
+
+        Returns:
+            self:
+                Fitted imputer.
+        """
+
+        grouped = (
+            X.lazy()
+            .group_by("Working Professional or Student")
+            .agg(pl.col(self.cols_to_impute).median())
+            .drop_nulls("Working Professional or Student")
+            .collect()
+        )
+        groups = grouped["Working Professional or Student"].cast(pl.String).to_list()
+        for col in self.cols_to_impute:
+            self.medians[col] = dict(zip(groups, grouped[col].to_list()))
+        return self
+
+    def transform(self, X):
+        """
+        Apply learned median imputation to the data.
+
+        args:
+            X (pl.DataFrame or pl.LazyFrame):
+                Data to transform.
+
+        Returns:
+            pl.DataFrame or pl.LazyFrame:
+                Same frame type with missing values imputed.
+        """
+
+        occupation = pl.col("Working Professional or Student").cast(pl.String)
+        return X.with_columns(
+            pl.col(col).fill_null(
+                occupation.replace_strict(self.medians[col], default=None, return_dtype=pl.Float64)
+            )
+            for col in self.cols_to_impute
+        )
+
+def add_pressure_ratio(X):
+    """Add Pressure/Satisfaction ratio feature with epsilon to avoid division by zero
+
+    args:
+        X (pl.DataFrame or pl.LazyFrame):
+            Data to transform.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame:
+            Transformed data with Pressure/Satisfaction ratio
+    """
+
+    return X.with_columns(
+        (pl.col("Pressure") / (pl.col("Satisfaction") + 1e-6)).alias("Pressure_Satisfaction_Ratio")
+    )
+
+def preprocess(data, imputer):
+    """
+    Run every preprocessing step as one lazy Polars query.
+
+    Polars fuses the stages into a single multithreaded plan and only
+    materializes the result at `collect()`.
+
+    Args:
+        data (pl.DataFrame or pl.LazyFrame):
+            Raw input frame.
+        imputer (GroupImputer):
+            Imputer fitted on `assign_satisfaction(assign_pressure(train))`.
+
+    Returns:
+        pl.DataFrame:
+            Preprocessed frame, before column dropping and encoding.
+    """
+
+    steps = [
+        assign_pressure,
+        assign_satisfaction,
+        imputer.transform,
+        add_pressure_ratio,
+        replace_diet_habits,
+        replace_sleep_duration,
+    ]
+    lazy = data.lazy()
+    for step in steps:
+        lazy = step(lazy)
+    return lazy.collect()
@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("dask")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import preprocess
+import preprocess_dask
+
+def test_preprocess_frame_keeps_input_row_order():
+    rng = np.random.default_rng(0)
+    n = 200
+    data = pd.DataFrame({
+        "Working Professional or Student": rng.choice(["Student", "Working Professional"], n),
+        "Academic Pressure": rng.choice([1.0, 3.0, np.nan], n),
+        "Work Pressure": rng.choice([2.0, 5.0, np.nan], n),
+        "Study Satisfaction": rng.choice([1.0, 4.0, np.nan], n),
+        "Job Satisfaction": rng.choice([2.0, 3.0, np.nan], n),
+        "Financial Stress": rng.choice([1.0, 5.0, np.nan], n),
+        "Dietary Habits": rng.choice(["Healthy", "Moderate", "Yes"], n),
+        "Sleep Duration": rng.choice(["5-6 hours", "7-8 hours", "No"], n),
+    }, index=rng.permutation(n))  # Shuffled, as after a stratified train_test_split
+
+    cols = ["Pressure", "Satisfaction", "Financial Stress"]
+    ddf = preprocess_dask.to_dask(data, npartitions=4)
+    imputer = preprocess_dask.GroupImputer(cols).fit(
+        preprocess_dask.assign_satisfaction(preprocess_dask.assign_pressure(ddf))
+    )
+    result = preprocess_dask.preprocess_frame(data, imputer, npartitions=4)
+
+    expected = preprocess.replace_sleep_duration(preprocess.replace_diet_habits(
+        preprocess.add_pressure_ratio(preprocess.GroupImputer.transform(imputer, preprocess.apply_occupation_features(data)))
+    ))
+    assert result.index.tolist() == data.index.tolist()
+    for col in cols + ["Pressure_Satisfaction_Ratio"]:
+        np.testing.assert_allclose(result[col].to_numpy(float), expected[col].to_numpy(float), equal_nan=True)